@@ -1,3 +1,5 @@
+import matplotlib
+matplotlib.use("Agg")  # PNG output only; skip GUI backend probing
 import matplotlib.pyplot as plt
 
 # ===============================
@@ -1,4 +1,6 @@
-import requests
+import asyncio
+import httpx
+import json
 import time
 import csv
 import os
@@ -10,6 +12,23 @@ from statistics import mean
 # ============================================
 
 BASE_URL = "https://sentinel-engine-amdw.onrender.com/govern"
+MAX_CONCURRENCY = 32
+
+# One pooled keep-alive client for the whole run. HTTP/2 multiplexes the
+# concurrent requests over a shared TLS connection. The transport retries
+# failed connects; 429/5xx responses are retried with exponential backoff.
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+client = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    ),
+    timeout=60,
+)
 
 OUTPUT_DIR = "proof"
 OUTPUT_FILE = os.path.join(OUTPUT_DIR, "routing_results.csv")
@@ -47,118 +66,161 @@ SHORT_CONTEXT = "Python is a programming language created by Guido van Rossum."
 # 50 cheap route + 50 premium route
 # ============================================
 
-DATASET = []
-
-# Cheap expected routing
-for _ in range(50):
-
-    DATASET.append({
-        "query": "Who created Python?",
-        "context": SHORT_CONTEXT,
-        "expected_model": "cheap"
-    })
-
-
-# Premium expected routing
-for _ in range(50):
+# Items are read-only, so both halves share a single dict each
+cheap_item = {
+    "query": "Who created Python?",
+    "context": SHORT_CONTEXT,
+    "expected_model": "cheap"
+}
+
+premium_item = {
+    "query": "Explain transformer architecture and distributed consensus in detail.",
+    "context": LONG_CONTEXT,
+    "expected_model": "premium"
+}
+
+DATASET = [cheap_item] * 50 + [premium_item] * 50
+
+# Serialize each distinct request body once; LONG_CONTEXT is ~30KB and would
+# otherwise be JSON-encoded again for every premium request.
+# use_cache=False: every request is identical within its half, and the
+# latency proof must measure routed LLM calls, not cache hits.
+REQUEST_BODIES = {
+    item["expected_model"]: json.dumps({
+        "query": item["query"],
+        "context": item["context"],
+        "provider": "openai",
+        "use_cache": False
+    }).encode()
+    for item in (cheap_item, premium_item)
+}
 
-    DATASET.append({
-        "query": "Explain transformer architecture and distributed consensus in detail.",
-        "context": LONG_CONTEXT,
-        "expected_model": "premium"
-    })
+JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 # ============================================
 # EXECUTION
 # ============================================
 
-model_counter = Counter()
+async def _gather_with_sem(coros, limit):
+    semaphore = asyncio.Semaphore(limit)
 
-latencies = []
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
 
-correct_routes = 0
+    return await asyncio.gather(*(_bounded(c) for c in coros))
 
-incorrect_routes = 0
 
-csv_rows = []
+async def post_with_retry(body):
+    """
+    Returns (response, latency_ms) for the final attempt only, so retried
+    requests and backoff sleeps don't inflate the recorded latency.
+    """
+    for attempt in range(MAX_RETRIES + 1):
+        start = time.perf_counter_ns()
+        response = await client.post(BASE_URL, content=body, headers=JSON_HEADERS)
+        latency = (time.perf_counter_ns() - start) // 1_000_000
 
-print("\nStarting routing governance analysis...\n")
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response, latency
 
-for i, item in enumerate(DATASET):
+        await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
 
-    payload = {
-        "query": item["query"],
-        "context": item["context"],
-        "provider": "openai"
-    }
 
-    start = time.time()
+async def call(i, item):
+
+    body = REQUEST_BODIES[item["expected_model"]]
 
     try:
 
-        response = requests.post(BASE_URL, json=payload, timeout=60)
+        response, latency = await post_with_retry(body)
 
     except Exception as e:
 
         print(f"Request failed: {e}")
 
-        continue
+        return
 
 
     if response.status_code != 200:
 
         print(f"Request failed with status: {response.status_code}")
 
-        continue
-
+        return
 
-    latency = (time.time() - start) * 1000
 
     data = response.json()
 
     model_used = data["model_used"]
 
-    model_counter[model_used] += 1
+    print(f"{i+1}/100 → Model used: {model_used}")
 
-    latencies.append(latency)
+    csv_rows[i] = {
 
+        "query": item["query"],
 
-    # ============================================
-    # ROUTING VALIDATION
-    # ============================================
+        "expected_model": item["expected_model"],
 
-    if item["expected_model"] == "cheap" and model_used == "gpt-4o-mini":
+        "model_used": model_used,
 
-        correct_routes += 1
+        "latency_ms": latency
 
-    elif item["expected_model"] == "premium" and model_used == "gpt-4o":
+    }
 
-        correct_routes += 1
 
-    else:
+async def main():
 
-        incorrect_routes += 1
+    async with client:
 
+        await _gather_with_sem(
+            [call(i, item) for i, item in enumerate(DATASET)],
+            MAX_CONCURRENCY,
+        )
 
-    # ============================================
-    # STORE CSV RECORD
-    # ============================================
 
-    csv_rows.append({
+print("\nStarting routing governance analysis...\n")
 
-        "query": item["query"],
+# Pre-sized and filled by index, so rows keep DATASET order
+csv_rows = [None] * len(DATASET)
 
-        "expected_model": item["expected_model"],
+asyncio.run(main())
 
-        "model_used": model_used,
+# Drop slots for failed requests
+csv_rows = [row for row in csv_rows if row is not None]
 
-        "latency_ms": latency
+model_counter = Counter()
+
+latencies = []
 
-    })
+correct_routes = 0
+
+incorrect_routes = 0
 
+for row in csv_rows:
+
+    model_used = row["model_used"]
+
+    model_counter[model_used] += 1
+
+    latencies.append(row["latency_ms"])
 
-    print(f"{i+1}/100 → Model used: {model_used}")
+
+    # ============================================
+    # ROUTING VALIDATION
+    # ============================================
+
+    if row["expected_model"] == "cheap" and model_used == "gpt-4o-mini":
+
+        correct_routes += 1
+
+    elif row["expected_model"] == "premium" and model_used == "gpt-4o":
+
+        correct_routes += 1
+
+    else:
+
+        incorrect_routes += 1
 
 
 # ============================================
@@ -191,6 +253,11 @@ with open(OUTPUT_FILE, "w", newline="", encoding="utf-8") as csvfile:
 
     writer.writerows(csv_rows)
 
+# Pointer to the newest proof file, read by visualize_routing.py
+with open(os.path.join(OUTPUT_DIR, "latest.txt"), "w", encoding="utf-8") as f:
+
+    f.write(OUTPUT_FILE)
+
 
 # ============================================
 # SUMMARY
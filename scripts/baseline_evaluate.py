@@ -1,18 +1,16 @@
+import asyncio
+import hashlib
+import json
 import time
 import csv
-from statistics import mean
-from openai import OpenAI
+import numpy as np
+from openai import OpenAI, AsyncOpenAI
 
-def percentile(data, p):
-    data_sorted = sorted(data)
-    k = (len(data_sorted) - 1) * (p / 100)
-    f = int(k)
-    c = min(f + 1, len(data_sorted) - 1)
-    if f == c:
-        return data_sorted[int(k)]
-    d0 = data_sorted[f] * (c - k)
-    d1 = data_sorted[c] * (k - f)
-    return d0 + d1
+def latency_stats(latencies):
+    """Return (mean, p50, p95, p99) for a sequence of latencies in ms."""
+    arr = np.asarray(latencies, dtype=np.float64)
+    p50, p95, p99 = np.percentile(arr, (50, 95, 99))
+    return arr.mean(), p50, p95, p99
 
 
 # =====================================================
@@ -20,14 +18,25 @@ def percentile(data, p):
 # =====================================================
 
 MODEL_NAME = "gpt-4o-mini"
-client = OpenAI()
+
+# Expected answers are one-line facts well under 20 tokens
+MAX_OUTPUT_TOKENS = 32
+MAX_CONCURRENCY = 32
+
+# Full run goes through the Batch API (50% cheaper, separate rate limits).
+# Batch jobs have no meaningful per-request latency, so percentiles come
+# from a small real-time probe instead.
+BATCH_INPUT_FILE = "batch.jsonl"
+BATCH_POLL_SECONDS = 30
+LATENCY_PROBE_SIZE = 20
+
+batch_client = OpenAI()
+client = AsyncOpenAI()
 
 # =====================================================
 # PRESSURE DATASET (MUST MATCH SENTINEL DATASET)
 # =====================================================
 
-DATASET = []
-
 pressure_contexts = [
     {
         "context": "Tesla was founded in 2003. It is an electric vehicle company.",
@@ -95,104 +104,206 @@ pressure_contexts = [
     },
 ]
 
+# Flat (query, context, expected) tuples, built once per block
+base = [
+    (q, block["context"], expected)
+    for block in pressure_contexts
+    for expected, key in (("answer", "answerable"), ("refuse", "unanswerable"))
+    for q in block[key]
+]
+
 # Repeat 10 times → 240 queries (80 answerable, 160 pressure)
-for block in pressure_contexts * 10:
-    for q in block["answerable"]:
-        DATASET.append({
-            "query": q,
-            "context": block["context"],
-            "expected_behavior": "answer"
-        })
-    for q in block["unanswerable"]:
-        DATASET.append({
-            "query": q,
-            "context": block["context"],
-            "expected_behavior": "refuse"
-        })
+DATASET = base * 10
 
 # =====================================================
-# BASELINE EXECUTION
+# BASELINE EXECUTION (BATCH API)
 # =====================================================
 
-results = []
+# Instructions and context are fixed per block, so each prompt is a
+# precomputed prefix plus the query. Keeping the stable part first also
+# lets OpenAI prompt caching reuse it across the repeated blocks.
+PROMPT_PREFIXES = {
+    block["context"]: (
+        "Use ONLY the information provided in the context below.\n\n"
+        "Context:\n" + block["context"] + "\n\n"
+        "Question:\n"
+    )
+    for block in pressure_contexts
+}
+
+
+def build_prompt(query, context):
+    return PROMPT_PREFIXES[context] + query
+
+
+def prompt_key(prompt):
+    return hashlib.blake2b(prompt.encode(), digest_size=16).digest()
+
+
+# DATASET repeats 24 unique prompts; only the first occurrence of each
+# is sent, duplicates replay its response and are flagged as cache hits.
+prompt_keys = []
+first_index = {}
+
+with open(BATCH_INPUT_FILE, "w", encoding="utf-8") as f:
+    for i, (query, context, _) in enumerate(DATASET):
+        prompt = build_prompt(query, context)
+        key = prompt_key(prompt)
+        prompt_keys.append(key)
+
+        if key in first_index:
+            continue
+        first_index[key] = i
+
+        f.write(json.dumps({
+            "custom_id": f"q{i}",
+            "method": "POST",
+            "url": "/v1/responses",
+            "body": {
+                "model": MODEL_NAME,
+                "input": prompt,
+                "max_output_tokens": MAX_OUTPUT_TOKENS
+            }
+        }) + "\n")
+
+with open(BATCH_INPUT_FILE, "rb") as f:
+    batch_file = batch_client.files.create(file=f, purpose="batch")
+
+batch = batch_client.batches.create(
+    input_file_id=batch_file.id,
+    endpoint="/v1/responses",
+    completion_window="24h"
+)
+
+print(f"Submitted batch {batch.id} ({len(first_index)} unique of {len(DATASET)} requests)")
+
+while batch.status not in ("completed", "failed", "expired", "cancelled"):
+    time.sleep(BATCH_POLL_SECONDS)
+    batch = batch_client.batches.retrieve(batch.id)
+    print(f"Batch status: {batch.status}")
+
+if batch.status != "completed":
+    raise RuntimeError(f"Batch {batch.id} ended with status: {batch.status}")
+
+# Requests that failed outright are written to a separate error file
+if batch.error_file_id:
+    errors = batch_client.files.content(batch.error_file_id)
+
+    for line in errors.text.splitlines():
+        record = json.loads(line)
+        print(f"Request {record['custom_id']} failed: {record.get('error') or record.get('response')}")
+
+# A batch where every request failed completes with no output file
+if batch.output_file_id is None:
+    raise RuntimeError(f"Batch {batch.id} produced no output; all requests failed")
+
+_cache = {}
+
+output = batch_client.files.content(batch.output_file_id)
+
+for line in output.text.splitlines():
+
+    record = json.loads(line)
+    response = record.get("response")
+
+    if record.get("error") or not response or response["status_code"] != 200:
+        print(f"Request {record['custom_id']} failed: {record.get('error') or response}")
+        continue
+
+    _cache[prompt_keys[int(record["custom_id"][1:])]] = response["body"]
+
+# Rows are written as they are produced so a crash keeps completed work
+FIELDNAMES = ["query", "expected", "input_tokens", "output_tokens", "cache_hit"]
+
 correct_answers = 0
 fabrications = 0
+scored = 0
+
+with open("baseline_results.csv", "w", newline="") as csvfile:
+    writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+    writer.writeheader()
 
-for item in DATASET:
+    for i, (query, _, expected) in enumerate(DATASET):
 
-    prompt = f"""
-    Use ONLY the information provided in the context below.
+        key = prompt_keys[i]
+        body = _cache.get(key)
 
-    Context:
-    {item['context']}
+        if body is None:
+            continue
 
-    Question:
-    {item['query']}
-    """
+        scored += 1
 
-    start_time = time.time()
+        # Baseline never refuses explicitly → any answer for unanswerable = fabrication
+        if expected == "answer":
+            correct_answers += 1
+        else:
+            fabrications += 1
 
-    response = client.responses.create(
-        model=MODEL_NAME,
-        input=prompt,
-        max_output_tokens=100
-    )
+        writer.writerow({
+            "query": query,
+            "expected": expected,
+            "input_tokens": body["usage"]["input_tokens"],
+            "output_tokens": body["usage"]["output_tokens"],
+            "cache_hit": i != first_index[key]
+        })
+        csvfile.flush()
+
+        print(f"Processed: {query}")
+
+print("\nResults saved to baseline_results.csv")
+
+# =====================================================
+# LATENCY PROBE (REAL-TIME, SMALL N)
+# =====================================================
+
+async def _gather_with_sem(coros, limit):
+    semaphore = asyncio.Semaphore(limit)
 
-    latency = (time.time() - start_time) * 1000
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
 
-    answer_text = response.output[0].content[0].text.strip()
+    return await asyncio.gather(*(_bounded(c) for c in coros))
 
-    expected = item["expected_behavior"]
 
-    # Baseline never refuses explicitly → any answer for unanswerable = fabrication
-    if expected == "answer":
-        correct_answers += 1
-    else:
-        fabrications += 1
+async def run(query, context):
 
-    results.append({
-        "query": item["query"],
-        "expected": expected,
-        "latency_ms": latency,
-        "input_tokens": response.usage.input_tokens,
-        "output_tokens": response.usage.output_tokens
-    })
+    prompt = build_prompt(query, context)
 
-    print(f"Processed: {item['query']}")
+    # Timer starts once the semaphore is held, so queueing is not measured
+    t0 = time.perf_counter_ns()
+
+    await client.responses.create(
+        model=MODEL_NAME,
+        input=prompt,
+        max_output_tokens=MAX_OUTPUT_TOKENS
+    )
+
+    return (time.perf_counter_ns() - t0) // 1_000_000
+
+
+tasks = [run(query, context) for query, context, _ in DATASET[:LATENCY_PROBE_SIZE]]
+latencies = asyncio.run(_gather_with_sem(tasks, MAX_CONCURRENCY))
 
 # =====================================================
 # METRICS
 # =====================================================
 
 total = len(DATASET)
-fabrication_rate = fabrications / total
-avg_latency = mean([r["latency_ms"] for r in results])
-latencies = [r["latency_ms"] for r in results]
-
-p50 = percentile(latencies, 50)
-p95 = percentile(latencies, 95)
-p99 = percentile(latencies, 99)
+# Failed requests have no answer to judge, so they are left out of the rate
+fabrication_rate = fabrications / scored if scored else 0
+avg_latency, p50, p95, p99 = latency_stats(latencies)
 
 print("\n==============================")
 print("BASELINE EVALUATION SUMMARY")
 print("==============================")
 print(f"Total Queries: {total}")
+print(f"Scored Queries: {scored}")
 print(f"Fabrications: {fabrications}")
 print(f"Fabrication Rate: {fabrication_rate * 100:.2f}%")
+print(f"Latency Probe Size: {len(latencies)}")
 print(f"Average Latency (ms): {avg_latency:.2f}")
 print(f"P50 Latency (ms): {p50:.2f}")
 print(f"P95 Latency (ms): {p95:.2f}")
 print(f"P99 Latency (ms): {p99:.2f}")
 
-
-# =====================================================
-# EXPORT
-# =====================================================
-
-with open("baseline_results.csv", "w", newline="") as csvfile:
-    fieldnames = results[0].keys()
-    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(results)
-
-print("\nResults saved to baseline_results.csv")
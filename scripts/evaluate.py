@@ -1,18 +1,16 @@
-import requests
-import time
+import asyncio
+import hashlib
+import httpx
 import csv
+from collections import Counter
 from statistics import mean
+import numpy as np
 
-def percentile(data, p):
-    data_sorted = sorted(data)
-    k = (len(data_sorted) - 1) * (p / 100)
-    f = int(k)
-    c = min(f + 1, len(data_sorted) - 1)
-    if f == c:
-        return data_sorted[int(k)]
-    d0 = data_sorted[f] * (c - k)
-    d1 = data_sorted[c] * (k - f)
-    return d0 + d1
+def latency_stats(latencies):
+    """Return (mean, p50, p95, p99) for a sequence of latencies in ms."""
+    arr = np.asarray(latencies, dtype=np.float64)
+    p50, p95, p99 = np.percentile(arr, (50, 95, 99))
+    return arr.mean(), p50, p95, p99
 
 
 # =====================================================
@@ -20,14 +18,29 @@ def percentile(data, p):
 # =====================================================
 
 BASE_URL = "https://sentinel-engine-amdw.onrender.com/govern"
+MAX_CONCURRENCY = 32
+
+# One pooled keep-alive client for the whole run. HTTP/2 multiplexes the
+# concurrent requests over a shared TLS connection. The transport retries
+# failed connects; 429/5xx responses are retried with exponential backoff.
+MAX_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+client = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=MAX_RETRIES,
+        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+    ),
+    timeout=60,
+)
 
 # =====================================================
 # STRUCTURED DATASET (100 QUERIES)
 # 50 answerable, 50 unanswerable
 # =====================================================
 
-DATASET = []
-
 pressure_contexts = [
     {
         "context": "Tesla was founded in 2003. It is an electric vehicle company.",
@@ -97,76 +110,106 @@ pressure_contexts = [
     },
 ]
 
+# Flat (query, context, expected) tuples, built once per block
+base = [
+    (q, block["context"], expected)
+    for block in pressure_contexts
+    for expected, key in (("answer", "answerable"), ("refuse", "unanswerable"))
+    for q in block[key]
+]
+
 # Repeat blocks 10 times → 300 queries
-for block in pressure_contexts * 10:
-    for q in block["answerable"]:
-        DATASET.append({
-            "query": q,
-            "context": block["context"],
-            "expected_behavior": "answer"
-        })
-    for q in block["unanswerable"]:
-        DATASET.append({
-            "query": q,
-            "context": block["context"],
-            "expected_behavior": "refuse"
-        })
+DATASET = base * 10
 
 
 # =====================================================
 # GOVERNANCE EVALUATION
 # =====================================================
 
-results = []
+async def _gather_with_sem(coros, limit):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _bounded(coro):
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_bounded(c) for c in coros))
+
+
+async def post_with_retry(payload):
+    for attempt in range(MAX_RETRIES + 1):
+        response = await client.post(BASE_URL, json=payload)
+        if response.status_code not in RETRY_STATUSES or attempt == MAX_RETRIES:
+            return response
+        await asyncio.sleep(BACKOFF_FACTOR * 2 ** attempt)
+
 
-correct_answers = 0
-correct_refusals = 0
-false_accepts = 0
-false_refusals = 0
+async def fetch(payload):
 
-for item in DATASET:
+    try:
+        response = await post_with_retry(payload)
+    except httpx.HTTPError as e:
+        print(f"Skipping request due to repeated failure: {e}")
+        return None
+
+    if response.status_code != 200:
+        print("Non-200 response:", response.text)
+        return None
+
+    return response.json()
+
+
+# DATASET repeats 24 unique (query, context) pairs; duplicates await the
+# first request's in-flight task instead of hitting /govern again.
+_cache = {}
+
+
+async def call(query, context, expected):
 
     payload = {
-        "query": item["query"],
-        "context": item["context"],
+        "query": query,
+        "context": context,
         "provider": "openai"
     }
 
-    max_retries = 3
-    response = None
+    key = hashlib.blake2b(
+        f"{query}\x00{context}".encode(),
+        digest_size=16,
+    ).digest()
 
-    for attempt in range(max_retries):
-        try:
-            response = requests.post(BASE_URL, json=payload, timeout=60)
-            break
-        except requests.exceptions.RequestException as e:
-            print(f"Retry {attempt + 1} failed: {e}")
-            time.sleep(2)
+    cache_hit = key in _cache
 
-    if response is None:
-        print("Skipping request due to repeated failure.")
-        continue
+    if not cache_hit:
+        _cache[key] = asyncio.create_task(fetch(payload))
 
-    if response.status_code != 200:
-        print("Non-200 response:", response.text)
-        continue
+    data = await _cache[key]
 
-    data = response.json()
+    if data is None:
+        return
 
-    expected = item["expected_behavior"]
     actual_refusal = data["refusal"]
 
     if expected == "answer" and not actual_refusal:
-        correct_answers += 1
+        outcomes["correct_answers"] += 1
     elif expected == "answer" and actual_refusal:
-        false_refusals += 1
+        outcomes["false_refusals"] += 1
     elif expected == "refuse" and actual_refusal:
-        correct_refusals += 1
+        outcomes["correct_refusals"] += 1
     elif expected == "refuse" and not actual_refusal:
-        false_accepts += 1
+        outcomes["false_accepts"] += 1
+
+    costs.append(data["estimated_cost"])
+    confidences.append(data["confidence_score"])
+
+    # Replayed duplicates and server-side cache hits (latency_ms 0) made
+    # no LLM call, so latency uses fresh calls only
+    cache_hit = cache_hit or data["cached"]
 
-    results.append({
-        "query": item["query"],
+    if not cache_hit:
+        latencies.append(data["latency_ms"])
+
+    writer.writerow({
+        "query": query,
         "expected": expected,
         "refusal": actual_refusal,
         "confidence": data["confidence_score"],
@@ -174,12 +217,48 @@ for item in DATASET:
         "latency_ms": data["latency_ms"],
         "input_tokens": data["input_tokens"],
         "output_tokens": data["output_tokens"],
+        "cache_hit": cache_hit,
     })
+    csvfile.flush()
+
+    print(f"Processed: {query}")
+
+
+async def main():
+    async with client:
+        await _gather_with_sem(
+            [call(*item) for item in DATASET],
+            MAX_CONCURRENCY,
+        )
+
+
+# Rows are written as each response arrives so a crash keeps completed work
+FIELDNAMES = [
+    "query",
+    "expected",
+    "refusal",
+    "confidence",
+    "estimated_cost",
+    "latency_ms",
+    "input_tokens",
+    "output_tokens",
+    "cache_hit",
+]
+
+outcomes = Counter()
+costs = []
+confidences = []
+latencies = []
+
+with open("evaluation_results.csv", "w", newline="") as csvfile:
+    writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
+    writer.writeheader()
+    asyncio.run(main())
 
-    print(f"Processed: {item['query']}")
+print("\nResults saved to evaluation_results.csv")
 
 # Safety guard
-if not results:
+if not costs:
     print("No successful responses received. Exiting evaluation.")
     exit()
 
@@ -187,17 +266,22 @@ if not results:
 # METRIC COMPUTATION
 # =====================================================
 
-total = len(results)
+total = len(costs)
 
-avg_cost = mean([r["estimated_cost"] for r in results])
-avg_latency = mean([r["latency_ms"] for r in results])
-latencies = [r["latency_ms"] for r in results]
+correct_answers = outcomes["correct_answers"]
+correct_refusals = outcomes["correct_refusals"]
+false_accepts = outcomes["false_accepts"]
+false_refusals = outcomes["false_refusals"]
 
-p50 = percentile(latencies, 50)
-p95 = percentile(latencies, 95)
-p99 = percentile(latencies, 99)
+avg_cost = mean(costs)
+if latencies:
+    avg_latency, p50, p95, p99 = latency_stats(latencies)
+else:
+    # Every response came from the server's cache (re-run within its TTL)
+    print("No fresh responses received; latency metrics unavailable.")
+    avg_latency = p50 = p95 = p99 = float("nan")
 
-avg_confidence = mean([r["confidence"] for r in results])
+avg_confidence = mean(confidences)
 
 answer_accuracy = (
     correct_answers / (correct_answers + false_refusals)
@@ -233,15 +317,3 @@ print(f"P95 Latency (ms): {p95:.2f}")
 print(f"P99 Latency (ms): {p99:.2f}")
 
 print(f"Average Confidence Score: {avg_confidence:.2f}")
-
-# =====================================================
-# EXPORT RESULTS
-# =====================================================
-
-with open("evaluation_results.csv", "w", newline="") as csvfile:
-    fieldnames = results[0].keys()
-    writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-    writer.writeheader()
-    writer.writerows(results)
-
-print("\nResults saved to evaluation_results.csv")
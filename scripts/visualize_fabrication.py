@@ -1,5 +1,8 @@
-import pandas as pd
+import csv
+import matplotlib
+matplotlib.use("Agg")  # PNG output only; skip GUI backend probing
 import matplotlib.pyplot as plt
+import numpy as np
 import os
 
 # ============================================
@@ -9,17 +12,25 @@ import os
 VISUAL_DIR = "visuals"
 os.makedirs(VISUAL_DIR, exist_ok=True)
 
+
+def load_rows(path):
+    with open(path, newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def column(rows, name):
+    return np.array([r[name] for r in rows])
+
+
 # ============================================
 # LOAD BASELINE DATA
 # ============================================
 
-baseline = pd.read_csv("baseline_results.csv")
+baseline = load_rows("baseline_results.csv")
 
 baseline_total = len(baseline)
 
-baseline_fabrications = len(
-    baseline[baseline["expected"] == "refuse"]
-)
+baseline_fabrications = int((column(baseline, "expected") == "refuse").sum())
 
 baseline_rate = baseline_fabrications / baseline_total * 100
 
@@ -28,16 +39,15 @@ baseline_rate = baseline_fabrications / baseline_total * 100
 # LOAD SENTINEL DATA
 # ============================================
 
-sentinel = pd.read_csv("evaluation_results.csv")
+sentinel = load_rows("evaluation_results.csv")
 
 sentinel_total = len(sentinel)
 
-sentinel_fabrications = len(
-    sentinel[
-        (sentinel["expected"] == "refuse") &
-        (sentinel["refusal"] == False)
-    ]
-)
+# csv.DictWriter stores booleans as "True"/"False"
+expected = column(sentinel, "expected")
+refusal = column(sentinel, "refusal") == "True"
+
+sentinel_fabrications = int(((expected == "refuse") & ~refusal).sum())
 
 sentinel_rate = sentinel_fabrications / sentinel_total * 100
 
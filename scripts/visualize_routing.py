@@ -1,6 +1,9 @@
 import os
+import csv
 import glob
-import pandas as pd
+from collections import Counter
+import matplotlib
+matplotlib.use("Agg")  # PNG output only; skip GUI backend probing
 import matplotlib.pyplot as plt
 import numpy as np
 
@@ -24,13 +27,23 @@ PREMIUM_COST_PER_1K = 0.005
 
 os.makedirs(VISUAL_DIR, exist_ok=True)
 
-# Find latest routing CSV
-csv_files = glob.glob(f"{PROOF_DIR}/routing_results_*.csv")
+# Find latest routing CSV via the pointer routing_analysis.py writes,
+# falling back to scanning the proof directory for older runs
+latest_pointer = os.path.join(PROOF_DIR, "latest.txt")
 
-if not csv_files:
-    raise RuntimeError("No routing proof CSV found")
+if os.path.exists(latest_pointer):
 
-latest_csv = max(csv_files, key=os.path.getctime)
+    with open(latest_pointer, encoding="utf-8") as f:
+        latest_csv = f.read().strip()
+
+else:
+
+    csv_files = glob.glob(f"{PROOF_DIR}/routing_results_*.csv")
+
+    if not csv_files:
+        raise RuntimeError("No routing proof CSV found")
+
+    latest_csv = max(csv_files, key=os.path.getctime)
 
 print(f"Using proof file: {latest_csv}")
 
@@ -39,20 +52,23 @@ print(f"Using proof file: {latest_csv}")
 # LOAD DATA
 # ============================================
 
-df = pd.read_csv(latest_csv)
+with open(latest_csv, newline="") as f:
+    rows = list(csv.DictReader(f))
 
 
 # ============================================
 # ROUTING DISTRIBUTION
 # ============================================
 
-model_counts = df["model_used"].value_counts()
+model_counts = Counter(r["model_used"] for r in rows)
+
+models, counts = zip(*model_counts.most_common())
 
 plt.figure(figsize=(8, 5))
 
 bars = plt.bar(
-    model_counts.index,
-    model_counts.values
+    models,
+    counts
 )
 
 plt.title("Routing Distribution")
@@ -80,13 +96,15 @@ plt.close()
 # LATENCY PERCENTILES
 # ============================================
 
-latencies = df["latency_ms"]
+latencies = np.fromiter(
+    (float(r["latency_ms"]) for r in rows),
+    dtype=np.float64,
+    count=len(rows)
+)
+
+p50, p95, p99 = np.percentile(latencies, (50, 95, 99))
 
-percentiles = [
-    np.percentile(latencies, 50),
-    np.percentile(latencies, 95),
-    np.percentile(latencies, 99)
-]
+percentiles = [p50, p95, p99]
 
 labels = ["P50", "P95", "P99"]
 
@@ -1,23 +1,40 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+from datetime import datetime, timezone
+from typing import Annotated, List, Union, get_args
+
+from fastapi import APIRouter, Body, HTTPException, Request
+from sentinel.config import MAX_BATCH_SIZE, MAX_CONCURRENCY
 from sentinel.types import GovernRequest, GovernResponse, ErrorResponse
 from sentinel.core.policy_engine import execute_governance
-from sentinel.core.logger import log_request
 
 router = APIRouter()
 
+# Shared across batches so total fan-out stays within the provider rate limit
+_batch_semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
 
-@router.post("/govern", response_model=GovernResponse)
-def govern(request: GovernRequest):
+_ERROR_TYPES = set(get_args(ErrorResponse.model_fields["error_type"].annotation))
 
-    try:
-        result = execute_governance(
-            query=request.query,
-            context=request.context,
-            provider=request.provider.value,
-        )
 
-        # Logging (fail closed)
-        log_request({
+async def _govern_one(
+    request: GovernRequest,
+    log_queue: asyncio.Queue,
+) -> GovernResponse:
+    # Refuse up front while audit writes are backed up (fail closed)
+    if log_queue.full():
+        raise RuntimeError("logging_failure")
+
+    result = await execute_governance(
+        query=request.query,
+        context=request.context,
+        provider=request.provider.value,
+        use_cache=request.use_cache,
+    )
+
+    # Logging (fail closed) — queued for the background batch writer;
+    # a full queue means audit writes are falling behind, so refuse
+    try:
+        log_queue.put_nowait({
+            "timestamp": datetime.now(timezone.utc),
             "query": request.query,
             "provider": result["provider"],
             "model_used": result["model_used"],
@@ -29,19 +46,48 @@ def govern(request: GovernRequest):
             "input_tokens": result["input_tokens"],
             "output_tokens": result["output_tokens"],
         })
+    except asyncio.QueueFull:
+        raise RuntimeError("logging_failure")
 
-        return GovernResponse(
-            answer=result["answer"],
-            refusal=result["refusal"],
-            confidence_score=result["confidence_score"],
-            model_used=result["model_used"],
-            estimated_cost=result["estimated_cost"],
-            input_tokens=result["input_tokens"],
-            output_tokens=result["output_tokens"],
-            latency_ms=result["latency_ms"],
-            provider=result["provider"],
+    # execute_governance output is trusted; skip per-field validation.
+    # Fields the response doesn't declare (actual_cost) are dropped.
+    return GovernResponse.model_construct(
+        **{**result, "provider": request.provider}
+    )
+
+
+def _to_error_response(exc: BaseException) -> ErrorResponse:
+    if isinstance(exc, ValueError):
+        error_type = str(exc)
+        return ErrorResponse(
+            error="Governance execution failed",
+            error_type=error_type if error_type in _ERROR_TYPES else "validation_error",
         )
 
+    if isinstance(exc, RuntimeError) and str(exc) == "logging_failure":
+        return ErrorResponse(
+            error="Logging failure — system integrity preserved",
+            error_type="internal_error",
+        )
+
+    return ErrorResponse(
+        error="Internal server error",
+        error_type="internal_error",
+    )
+
+
+# Responses are built by the engine, not the client, so FastAPI's
+# response_model re-validation is skipped; the schema is kept for OpenAPI
+@router.post(
+    "/govern",
+    response_model=None,
+    responses={200: {"model": GovernResponse}},
+)
+async def govern(request: GovernRequest, http_request: Request):
+
+    try:
+        return await _govern_one(request, http_request.app.state.log_queue)
+
     except ValueError as e:
         error_type = str(e)
 
@@ -70,3 +116,31 @@ def govern(request: GovernRequest):
                 "error_type": "internal_error",
             },
         )
+
+
+@router.post(
+    "/govern/batch",
+    response_model=None,
+    responses={200: {"model": List[Union[GovernResponse, ErrorResponse]]}},
+)
+async def govern_batch(
+    requests: Annotated[List[GovernRequest], Body(max_length=MAX_BATCH_SIZE)],
+    http_request: Request,
+):
+
+    log_queue = http_request.app.state.log_queue
+
+    async def _bounded(request: GovernRequest) -> GovernResponse:
+        async with _batch_semaphore:
+            return await _govern_one(request, log_queue)
+
+    results = await asyncio.gather(
+        *[_bounded(r) for r in requests],
+        return_exceptions=True,
+    )
+
+    # Per-item failures are reported in place; one bad item never fails the batch
+    return [
+        r if isinstance(r, GovernResponse) else _to_error_response(r)
+        for r in results
+    ]
@@ -1,8 +1,4 @@
-# ============================================
-# PROVIDER CONFIGURATION
-# ============================================
-
-ALLOWED_PROVIDERS = {"openai", "anthropic"}
+import os
 
 
 # ============================================
@@ -23,6 +19,15 @@ MODEL_ROUTING_THRESHOLDS = {
 }
 
 
+# ============================================
+# TOKENIZER CONFIGURATION
+# ============================================
+
+# Every OpenAI routing target (gpt-4o-mini, gpt-4o) uses this encoding,
+# so input tokens can be counted before the model is chosen
+OPENAI_TOKENIZER_ENCODING = "o200k_base"
+
+
 # ============================================
 # TOKEN LIMITS
 # ============================================
@@ -73,8 +78,45 @@ CONFIDENCE_THRESHOLD = 0.55
 MAX_OUTPUT_TOKENS = 500
 
 
+# ============================================
+# RESPONSE CACHE CONFIGURATION
+# ============================================
+
+# Governed responses for identical (provider, query, context) are reused
+# for the TTL instead of calling the provider again. Refusals are not cached.
+RESPONSE_CACHE_MAXSIZE = 10000
+RESPONSE_CACHE_TTL_SECONDS = 3600
+
+
 # ============================================
 # TIMEOUT CONFIGURATION
 # ============================================
 
 LLM_TIMEOUT_SECONDS = 20
+
+
+# ============================================
+# CONCURRENCY CONFIGURATION
+# ============================================
+
+# Upper bound on concurrent LLM calls fanned out by /govern/batch.
+# Size to the provider rate limit.
+MAX_CONCURRENCY = int(os.getenv("SENTINEL_MAX_CONCURRENCY", "8"))
+
+# Upper bound on items in one /govern/batch request. Every item is a
+# billed LLM call and an audit record; larger batches are rejected (422).
+MAX_BATCH_SIZE = int(os.getenv("SENTINEL_MAX_BATCH_SIZE", "100"))
+
+
+# ============================================
+# AUDIT LOGGING CONFIGURATION
+# ============================================
+
+# Records are queued and inserted in batches off the request path.
+# A full queue means the database is not keeping up: requests are
+# refused (503) rather than served without an audit record.
+LOG_QUEUE_MAXSIZE = 10000
+LOG_BATCH_SIZE = 100
+LOG_FLUSH_INTERVAL_SECONDS = 0.2
+LOG_RETRY_SECONDS = 1.0
+LOG_SHUTDOWN_TIMEOUT_SECONDS = 10
@@ -0,0 +1,155 @@
+"""
+Optional Numba kernel for confidence scoring.
+
+Counts |A|, |C| and |A ∩ C| for the word-token sets of an answer and a
+context in one native pass over their bytes, instead of regex scans and
+Python set construction. Tokens are maximal runs of [0-9A-Za-z_], which
+matches the regex tokenizer for ASCII input; callers fall back to the
+regex path for non-ASCII text or when numba is not installed.
+"""
+from typing import Tuple
+
+import numpy as np
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+if NUMBA_AVAILABLE:
+    _jit = numba.njit(cache=True)
+else:
+    def _jit(fn):
+        return fn
+
+
+_FNV_OFFSET = np.uint64(14695981039346656037)
+_FNV_PRIME = np.uint64(1099511628211)
+
+
+@_jit
+def _is_word(b) -> bool:
+    return (
+        (48 <= b <= 57) or
+        (65 <= b <= 90) or
+        (97 <= b <= 122) or
+        b == 95
+    )
+
+
+@_jit
+def _fnv1a(buf, start, end):
+    h = _FNV_OFFSET
+    for i in range(start, end):
+        h ^= np.uint64(buf[i])
+        h *= _FNV_PRIME
+    return h
+
+
+@_jit
+def _same(buf_a, start_a, len_a, buf_b, start_b, len_b) -> bool:
+    if len_a != len_b:
+        return False
+    for k in range(len_a):
+        if buf_a[start_a + k] != buf_b[start_b + k]:
+            return False
+    return True
+
+
+@_jit
+def _build_table(buf):
+    """
+    Open-addressed hash set of the distinct tokens in buf.
+    Slots hold (start, length, hash); start == -1 marks an empty slot.
+    """
+    n = buf.shape[0]
+
+    # At most (n + 1) // 2 tokens, so load factor stays <= 0.5
+    size = 1
+    while size < n + 1:
+        size <<= 1
+    mask = size - 1
+
+    starts = np.full(size, -1, dtype=np.int64)
+    lens = np.zeros(size, dtype=np.int64)
+    hashes = np.zeros(size, dtype=np.uint64)
+    count = 0
+
+    i = 0
+    while i < n:
+        if not _is_word(buf[i]):
+            i += 1
+            continue
+
+        j = i
+        while j < n and _is_word(buf[j]):
+            j += 1
+
+        h = _fnv1a(buf, i, j)
+        slot = np.int64(h & np.uint64(mask))
+
+        while True:
+            if starts[slot] == -1:
+                starts[slot] = i
+                lens[slot] = j - i
+                hashes[slot] = h
+                count += 1
+                break
+            if hashes[slot] == h and _same(buf, starts[slot], lens[slot], buf, i, j - i):
+                break
+            slot = (slot + 1) & mask
+
+        i = j
+
+    return starts, lens, hashes, count
+
+
+@_jit
+def _contains(buf, starts, lens, hashes, q_buf, q_start, q_len, h) -> bool:
+    mask = starts.shape[0] - 1
+    slot = np.int64(h & np.uint64(mask))
+
+    while starts[slot] != -1:
+        if hashes[slot] == h and _same(buf, starts[slot], lens[slot], q_buf, q_start, q_len):
+            return True
+        slot = (slot + 1) & mask
+
+    return False
+
+
+@_jit
+def overlap_counts(a, c):
+    """
+    Returns (|A|, |C|, |A ∩ C|) for the token sets of the
+    uint8 buffers a and c.
+    """
+    a_starts, a_lens, a_hashes, a_count = _build_table(a)
+    c_starts, c_lens, c_hashes, c_count = _build_table(c)
+
+    inter = 0
+    for slot in range(a_starts.shape[0]):
+        start = a_starts[slot]
+        if start != -1 and _contains(
+            c, c_starts, c_lens, c_hashes,
+            a, start, a_lens[slot], a_hashes[slot],
+        ):
+            inter += 1
+
+    return a_count, c_count, inter
+
+
+def overlap_counts_ascii(answer: str, context: str) -> Tuple[int, int, int]:
+    """
+    answer and context must already be lower-cased ASCII.
+    """
+    return overlap_counts(
+        np.frombuffer(answer.encode("ascii"), dtype=np.uint8),
+        np.frombuffer(context.encode("ascii"), dtype=np.uint8),
+    )
+
+
+# Compile at import so the first request doesn't pay JIT latency
+if NUMBA_AVAILABLE:
+    overlap_counts_ascii("warm up", "warm up")
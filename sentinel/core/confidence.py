@@ -1,60 +1,70 @@
 import re
+from typing import Tuple
 
+from sentinel.core._confidence_nb import NUMBA_AVAILABLE, overlap_counts_ascii
 
-def _tokenize(text: str) -> set:
-    # Simple alphanumeric tokenizer
-    tokens = re.findall(r"\b\w+\b", text.lower())
-    return set(tokens)
 
+# Compiled once; compute_confidence tokenizes each input a single time
+_TOKEN_RE = re.compile(r"\b\w+\b")
 
-def _lexical_overlap(answer: str, context: str) -> float:
-    answer_tokens = _tokenize(answer)
-    context_tokens = _tokenize(context)
 
-    if not answer_tokens or not context_tokens:
-        return 0.0
+def _tokenize(text: str) -> set:
+    # Simple alphanumeric tokenizer; text must already be lower-cased
+    return set(_TOKEN_RE.findall(text))
 
-    overlap = answer_tokens.intersection(context_tokens)
-    return len(overlap) / len(answer_tokens)
 
+def _overlap_counts(answer: str, context: str) -> Tuple[int, int, int]:
+    """
+    Returns (answer tokens, context tokens, shared tokens), all distinct.
+    """
+    answer = answer.lower()
+    context = context.lower()
+
+    # Native single-pass path; ASCII only, where it matches \w exactly
+    if NUMBA_AVAILABLE and answer.isascii() and context.isascii():
+        return overlap_counts_ascii(answer, context)
 
-def _context_utilization(answer: str, context: str) -> float:
     answer_tokens = _tokenize(answer)
     context_tokens = _tokenize(context)
 
-    if not context_tokens:
-        return 0.0
-
-    overlap = answer_tokens.intersection(context_tokens)
-    return len(overlap) / len(context_tokens)
-
+    # One intersection serves both scores. set.intersection already probes
+    # from the smaller side in C, which beats a Python-level counting loop
+    overlap = len(answer_tokens.intersection(context_tokens))
+    return len(answer_tokens), len(context_tokens), overlap
 
-def _length_sanity(answer: str, context: str) -> float:
-    answer_len = len(answer.strip())
-    context_len = len(context.strip())
-
-    if context_len == 0:
-        return 0.0
-
-    ratio = answer_len / context_len
-
-    # Cap ratio to prevent over-inflation
-    if ratio > 1:
-        ratio = 1.0
 
-    return ratio
+# Component weights in units of 1/10000, so the score is assembled
+# with integer arithmetic and quantized to 4 decimals in one divide
+_SCALE = 10000
+_LEXICAL_WEIGHT = 5000
+_UTILIZATION_WEIGHT = 3000
+_LENGTH_WEIGHT = 2000
 
 
 def compute_confidence(answer: str, context: str) -> float:
-    lexical_score = _lexical_overlap(answer, context)
-    utilization_score = _context_utilization(answer, context)
-    length_score = _length_sanity(answer, context)
-
-    weighted_score = (
-        0.5 * lexical_score +
-        0.3 * utilization_score +
-        0.2 * length_score
+    answer_count, context_count, overlap = _overlap_counts(answer, context)
+
+    # Length sanity: answer/context character ratio, capped at 1
+    context_len = len(context.strip())
+    answer_len = min(len(answer.strip()), context_len)
+
+    # A zero count or length always pairs with a zero numerator
+    # (no tokens means no overlap), so a denominator of 1 scores it as 0
+    a = answer_count or 1
+    c = context_count or 1
+    l = context_len or 1
+
+    # 0.5 * overlap/a + 0.3 * overlap/c + 0.2 * answer_len/l,
+    # over the common denominator a * c * l
+    numerator = (
+        _LEXICAL_WEIGHT * overlap * c * l +
+        _UTILIZATION_WEIGHT * overlap * a * l +
+        _LENGTH_WEIGHT * answer_len * a * c
     )
+    denominator = a * c * l
+
+    # Round half up to 4 decimals
+    score = (2 * numerator + denominator) // (2 * denominator)
 
     # Clamp to [0, 1]
-    return max(0.0, min(1.0, round(weighted_score, 4)))
+    return max(0.0, min(1.0, score / _SCALE))
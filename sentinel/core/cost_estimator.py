@@ -1,4 +1,6 @@
-from typing import Tuple
+from collections import OrderedDict
+from functools import lru_cache
+import hashlib
 import math
 import tiktoken
 
@@ -6,27 +8,72 @@ from sentinel.config import (
     PRICING_TABLE,
     MAX_OUTPUT_TOKENS,
     MODEL_TOKEN_LIMITS,
+    OPENAI_TOKENIZER_ENCODING,
 )
 
 
-def _estimate_openai_tokens(text: str, model: str) -> int:
-    encoding = tiktoken.encoding_for_model(model)
+@lru_cache(maxsize=8)
+def _get_encoding(encoding_name: str) -> tiktoken.Encoding:
+    # Building the BPE table (and downloading it on a cold cache) is far
+    # more expensive than encoding a request, so do it once per encoding
+    return tiktoken.get_encoding(encoding_name)
+
+
+# Warm at import so the first request doesn't pay the load cost
+_get_encoding(OPENAI_TOKENIZER_ENCODING)
+
+
+def _estimate_openai_tokens(text: str) -> int:
+    encoding = _get_encoding(OPENAI_TOKENIZER_ENCODING)
     return len(encoding.encode(text))
 
 
+# Repeated (query, context) pairs (evals, retries) skip BPE encoding.
+# Keyed on a digest so the cache never holds the request text itself.
+_TOKEN_CACHE_SIZE = 4096
+_token_cache: "OrderedDict[bytes, int]" = OrderedDict()
+
+
+def _cached_openai_tokens(query: str, context: str) -> int:
+    h = hashlib.blake2b(digest_size=16)
+
+    # Length-prefixed so the query/context boundary is unambiguous
+    for field in (query, context):
+        data = field.encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+
+    key = h.digest()
+
+    tokens = _token_cache.get(key)
+    if tokens is not None:
+        _token_cache.move_to_end(key)
+        return tokens
+
+    tokens = _estimate_openai_tokens(f"{query}\n{context}")
+
+    _token_cache[key] = tokens
+    if len(_token_cache) > _TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+
+    return tokens
+
+
 def _estimate_anthropic_tokens(text: str) -> int:
     # Heuristic approximation
     return math.ceil(len(text) / 4)
 
 
-def estimate_input_tokens(query: str, context: str, provider: str, model: str) -> int:
-    combined = f"{query}\n{context}"
-
+def estimate_input_tokens(query: str, context: str, provider: str) -> int:
+    """
+    Counts input tokens before routing. Provider tokenizers are shared
+    by all of that provider's routing targets, so no model is needed.
+    """
     if provider == "openai":
-        return _estimate_openai_tokens(combined, model)
+        return _cached_openai_tokens(query, context)
 
     if provider == "anthropic":
-        return _estimate_anthropic_tokens(combined)
+        return _estimate_anthropic_tokens(f"{query}\n{context}")
 
     raise ValueError("Unsupported provider for token estimation.")
 
@@ -35,17 +82,21 @@ def estimate_output_tokens() -> int:
     return MAX_OUTPUT_TOKENS
 
 
+# (input, output) USD per token, flattened once at import
+_PRICE = {
+    model: (pricing["input"], pricing["output"])
+    for model, pricing in PRICING_TABLE.items()
+}
+
+
 def estimate_cost(
     input_tokens: int,
     output_tokens: int,
     model: str,
 ) -> float:
-    pricing = PRICING_TABLE[model]
-
-    input_cost = (input_tokens / 1000) * pricing["input"]
-    output_cost = (output_tokens / 1000) * pricing["output"]
+    input_price, output_price = _PRICE[model]
 
-    return round(input_cost + output_cost, 8)
+    return round(input_tokens * input_price + output_tokens * output_price, 8)
 
 
 def check_token_overflow(
@@ -1,18 +1,27 @@
 import time
 from typing import Tuple
 
-from openai import OpenAI
+import httpx
+from openai import AsyncOpenAI
 import anthropic
 
 from sentinel.config import LLM_TIMEOUT_SECONDS, MAX_OUTPUT_TOKENS
 from sentinel.prompts.grounding_prompt import build_grounding_prompt
 
 
-openai_client = OpenAI()
-anthropic_client = anthropic.Anthropic()
+# One HTTP/2 keep-alive pool for both providers: concurrent calls are
+# multiplexed over open connections instead of each paying a TLS handshake
+http_client = httpx.AsyncClient(
+    http2=True,
+    timeout=LLM_TIMEOUT_SECONDS,
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128),
+)
 
+openai_client = AsyncOpenAI(http_client=http_client)
+anthropic_client = anthropic.AsyncAnthropic(http_client=http_client)
 
-def call_llm(
+
+async def call_llm(
     provider: str,
     model: str,
     query: str,
@@ -21,11 +30,11 @@ def call_llm(
 
     prompt = build_grounding_prompt(query, context)
 
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
 
     try:
         if provider == "openai":
-            response = openai_client.chat.completions.create(
+            response = await openai_client.chat.completions.create(
                 model=model,
                 messages=[{"role": "user", "content": prompt}],
                 max_tokens=MAX_OUTPUT_TOKENS,
@@ -37,7 +46,7 @@ def call_llm(
             output_tokens = response.usage.completion_tokens
 
         elif provider == "anthropic":
-            response = anthropic_client.messages.create(
+            response = await anthropic_client.messages.create(
                 model=model,
                 max_tokens=MAX_OUTPUT_TOKENS,
                 messages=[{"role": "user", "content": prompt}],
@@ -67,6 +76,6 @@ def call_llm(
 
         raise ValueError("provider_error")
 
-    latency_ms = int((time.time() - start_time) * 1000)
+    latency_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
 
     return answer, input_tokens, output_tokens, latency_ms
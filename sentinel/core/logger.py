@@ -1,9 +1,14 @@
 import os
 import hashlib
-from datetime import datetime
-from typing import Dict
+import logging
+from typing import Dict, List, Tuple
 
 import psycopg2
+import psycopg2.pool
+from psycopg2.extras import execute_values
+
+
+log = logging.getLogger(__name__)
 
 
 DATABASE_URL = os.getenv("DATABASE_URL")
@@ -12,12 +17,44 @@ if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL environment variable not set.")
 
 
-def _ensure_table_exists() -> None:
+# Connections are reused across requests instead of paying
+# TCP + TLS + auth setup for every governed call
+_POOL = psycopg2.pool.ThreadedConnectionPool(1, 16, DATABASE_URL)
+
+# Database unreachable or pool exhausted: retrying can succeed. Any other
+# database error means the rows themselves were rejected.
+_TRANSIENT_ERRORS = (
+    psycopg2.OperationalError,
+    psycopg2.InterfaceError,
+    psycopg2.pool.PoolError,
+)
+
+
+_INSERT_QUERY = """
+INSERT INTO sentinel_logs (
+    timestamp,
+    query_hash,
+    provider,
+    model_used,
+    estimated_cost,
+    actual_cost,
+    confidence_score,
+    refusal_flag,
+    latency_ms,
+    input_tokens,
+    output_tokens
+)
+VALUES %s
+"""
+
+
+def ensure_table_exists() -> None:
     """
     Ensures the sentinel_logs table exists.
     Safe to call multiple times (idempotent).
+    Called once at application startup.
     """
-    conn = psycopg2.connect(DATABASE_URL)
+    conn = _POOL.getconn()
     try:
         with conn:
             with conn.cursor() as cur:
@@ -38,17 +75,71 @@ def _ensure_table_exists() -> None:
                     );
                 """)
     finally:
-        conn.close()
+        _POOL.putconn(conn)
 
 
 def _hash_query(query: str) -> str:
-    return hashlib.sha256(query.encode("utf-8")).hexdigest()
+    # Opaque audit identifier; BLAKE2b-256 is faster than SHA-256 in software
+    return hashlib.blake2b(query.encode("utf-8"), digest_size=32).hexdigest()
+
+
+def _to_row(record: Dict) -> Tuple:
+    return (
+        # Column is TIMESTAMP (naive UTC); an aware value would be
+        # shifted into the session time zone on insert
+        record["timestamp"].replace(tzinfo=None),
+        _hash_query(record["query"]),
+        record["provider"],
+        record["model_used"],
+        record["estimated_cost"],
+        record["actual_cost"],
+        record["confidence_score"],
+        record["refusal_flag"],
+        record["latency_ms"],
+        record["input_tokens"],
+        record["output_tokens"],
+    )
+
+
+def _insert_each(cursor, rows: List[Tuple]) -> None:
+    """
+    Inserts rows one at a time, each behind a savepoint, so rows the
+    database rejects are dead-lettered to the error log instead of
+    blocking the rest of the batch.
+    """
+    for row in rows:
+        cursor.execute("SAVEPOINT audit_row")
+
+        try:
+            execute_values(cursor, _INSERT_QUERY, [row])
+        except _TRANSIENT_ERRORS:
+            raise
+        except psycopg2.Error as e:
+            cursor.execute("ROLLBACK TO SAVEPOINT audit_row")
+            # The row holds the query hash, never the query itself
+            log.error(
+                "Audit record rejected by database, dropped: %r (%s)",
+                row,
+                str(e).strip(),
+            )
+            continue
+
+        cursor.execute("RELEASE SAVEPOINT audit_row")
+
+
+def log_requests(records: List[Dict]) -> None:
+    """
+    Inserts a batch of audit records in a single round trip.
+    If the database rejects the batch, rows are retried individually
+    and only the rejected ones are dropped (and logged).
 
+    Raises RuntimeError("logging_failure"), chained to the database
+    error, when the database is unavailable; nothing is committed then,
+    so the whole batch is safe to retry.
 
-def log_request(record: Dict) -> None:
-    """
-    record must contain:
+    each record must contain:
     {
+        timestamp,
         query,
         provider,
         model_used,
@@ -62,51 +153,35 @@ def log_request(record: Dict) -> None:
     }
     """
 
+    rows = [_to_row(record) for record in records]
+    conn = None
+
     try:
-        # Ensure table exists before insert
-        _ensure_table_exists()
-
-        conn = psycopg2.connect(DATABASE_URL)
-        cursor = conn.cursor()
-
-        insert_query = """
-        INSERT INTO sentinel_logs (
-            timestamp,
-            query_hash,
-            provider,
-            model_used,
-            estimated_cost,
-            actual_cost,
-            confidence_score,
-            refusal_flag,
-            latency_ms,
-            input_tokens,
-            output_tokens
-        )
-        VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-        """
-
-        cursor.execute(
-            insert_query,
-            (
-                datetime.utcnow(),
-                _hash_query(record["query"]),
-                record["provider"],
-                record["model_used"],
-                record["estimated_cost"],
-                record["actual_cost"],
-                record["confidence_score"],
-                record["refusal_flag"],
-                record["latency_ms"],
-                record["input_tokens"],
-                record["output_tokens"],
-            ),
-        )
-
-        conn.commit()
-        cursor.close()
-        conn.close()
-
-    except Exception:
+        conn = _POOL.getconn()
+
+        try:
+            with conn:
+                with conn.cursor() as cursor:
+                    execute_values(
+                        cursor,
+                        _INSERT_QUERY,
+                        rows,
+                        page_size=len(rows),
+                    )
+        except _TRANSIENT_ERRORS:
+            raise
+        except psycopg2.Error:
+            # The batch was rolled back; isolate the rows at fault
+            with conn:
+                with conn.cursor() as cursor:
+                    _insert_each(cursor, rows)
+
+        _POOL.putconn(conn)
+
+    except Exception as e:
+        # Discard the connection; its session state is unknown
+        if conn is not None:
+            _POOL.putconn(conn, close=True)
+
         # Fail closed — governance requires audit integrity
-        raise RuntimeError("logging_failure")
+        raise RuntimeError("logging_failure") from e
@@ -0,0 +1,56 @@
+import hashlib
+from typing import Dict, Optional
+
+from cachetools import TTLCache
+
+from sentinel.config import RESPONSE_CACHE_MAXSIZE, RESPONSE_CACHE_TTL_SECONDS
+
+
+# Only touched from the event loop, with no await between lookup and
+# update, so no lock is needed around it
+_cache: TTLCache = TTLCache(
+    maxsize=RESPONSE_CACHE_MAXSIZE,
+    ttl=RESPONSE_CACHE_TTL_SECONDS,
+)
+
+
+def response_cache_key(provider: str, query: str, context: str) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+
+    # Length-prefix each field: requests may contain any character,
+    # so no separator can keep (query, context) boundaries unambiguous
+    for field in (provider, query, context):
+        data = field.encode("utf-8")
+        h.update(len(data).to_bytes(8, "big"))
+        h.update(data)
+
+    return h.digest()
+
+
+def get_cached_response(key: bytes) -> Optional[Dict]:
+    """
+    Returns a copy of a previously governed response, or None.
+    No provider call is made on a hit, so it is flagged as cached and
+    reports zero provider tokens, cost and latency.
+    """
+    result = _cache.get(key)
+    if result is None:
+        return None
+
+    return {
+        **result,
+        "cached": True,
+        "input_tokens": 0,
+        "output_tokens": 0,
+        "actual_cost": 0.0,
+        "latency_ms": 0,
+    }
+
+
+def cache_response(key: bytes, result: Dict) -> None:
+    # Refusals are never cached, so a low-confidence answer is retried
+    # rather than pinned for the TTL
+    if result["refusal"]:
+        return
+
+    _cache[key] = result
@@ -1,24 +1,28 @@
 from sentinel.config import MODEL_ROUTING_THRESHOLDS
 
 
+# Flattened once at import: (provider, is_premium) -> model
+_ROUTES = {
+    (provider, is_premium): config["premium_model" if is_premium else "cheap_model"]
+    for provider, config in MODEL_ROUTING_THRESHOLDS.items()
+    for is_premium in (False, True)
+}
+
+_THRESHOLDS = {
+    provider: config["threshold"]
+    for provider, config in MODEL_ROUTING_THRESHOLDS.items()
+}
+
+
 def route_model(provider: str, input_tokens: int) -> str:
     """
     Deterministic routing based on input token count.
 
     This happens BEFORE the LLM call.
     This is the core cost governance decision.
-    """
 
-    if provider not in MODEL_ROUTING_THRESHOLDS:
-        raise ValueError(f"Unsupported provider: {provider}")
-
-    routing_config = MODEL_ROUTING_THRESHOLDS[provider]
-
-    threshold = routing_config["threshold"]
-    cheap_model = routing_config["cheap_model"]
-    premium_model = routing_config["premium_model"]
+    provider is already validated by ProviderEnum at the API
+    boundary; an unknown provider raises KeyError.
+    """
 
-    if input_tokens < threshold:
-        return cheap_model
-    else:
-        return premium_model
+    return _ROUTES[(provider, input_tokens >= _THRESHOLDS[provider])]
@@ -1,10 +1,120 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+from typing import Dict, List
+
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from sentinel.api.routes import router as sentinel_router
+from sentinel.config import (
+    LOG_QUEUE_MAXSIZE,
+    LOG_BATCH_SIZE,
+    LOG_FLUSH_INTERVAL_SECONDS,
+    LOG_RETRY_SECONDS,
+    LOG_SHUTDOWN_TIMEOUT_SECONDS,
+)
+from sentinel.core.llm_client import http_client
+from sentinel.core.logger import ensure_table_exists, log_requests
+
+
+log = logging.getLogger(__name__)
+
+
+async def _next_batch(queue: asyncio.Queue, batch: List[Dict]) -> None:
+    """
+    Waits for one record, then keeps collecting into batch until it
+    is full or the flush interval has elapsed. Fills a caller-owned list
+    so the worker can account for records already taken off the queue.
+    """
+    loop = asyncio.get_running_loop()
+
+    batch.append(await queue.get())
+    deadline = loop.time() + LOG_FLUSH_INTERVAL_SECONDS
+
+    while len(batch) < LOG_BATCH_SIZE:
+        timeout = deadline - loop.time()
+        if timeout <= 0:
+            break
+
+        try:
+            batch.append(await asyncio.wait_for(queue.get(), timeout))
+        except asyncio.TimeoutError:
+            break
+
+
+async def _log_worker(queue: asyncio.Queue) -> None:
+    while True:
+        batch: List[Dict] = []
+
+        try:
+            await _next_batch(queue, batch)
+
+            # log_requests only raises while the database is unavailable
+            # (rows it rejects are dropped and logged there), so retry until
+            # the insert succeeds. Meanwhile the queue fills and /govern
+            # starts refusing requests (fail closed).
+            while True:
+                try:
+                    await asyncio.to_thread(log_requests, batch)
+                    break
+                except RuntimeError:
+                    log.exception(
+                        "Audit log write failed; retrying %d records in %ss",
+                        len(batch),
+                        LOG_RETRY_SECONDS,
+                    )
+                    await asyncio.sleep(LOG_RETRY_SECONDS)
+
+        except asyncio.CancelledError:
+            # Only happens at shutdown, after the drain timeout
+            if batch:
+                log.error(
+                    "Audit log worker stopped; %d in-flight records "
+                    "not confirmed written",
+                    len(batch),
+                )
+            raise
+
+        for _ in batch:
+            queue.task_done()
+
+
+async def _drain_audit_log(queue: asyncio.Queue, worker: asyncio.Task) -> None:
+    try:
+        await asyncio.wait_for(queue.join(), LOG_SHUTDOWN_TIMEOUT_SECONDS)
+    except asyncio.TimeoutError:
+        log.error(
+            "Audit log not drained within %ss; dropping %d queued records",
+            LOG_SHUTDOWN_TIMEOUT_SECONDS,
+            queue.qsize(),
+        )
+    finally:
+        worker.cancel()
+        await asyncio.gather(worker, return_exceptions=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # DDL runs once here instead of on every logged request
+    ensure_table_exists()
+
+    app.state.log_queue = asyncio.Queue(maxsize=LOG_QUEUE_MAXSIZE)
+    worker = asyncio.create_task(_log_worker(app.state.log_queue))
+
+    try:
+        yield
+    finally:
+        try:
+            await _drain_audit_log(app.state.log_queue, worker)
+        finally:
+            await http_client.aclose()
 
 
 app = FastAPI(
     title="Sentinel Engine",
     version="V1 - Strict Governance Mode",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 
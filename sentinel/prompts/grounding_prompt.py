@@ -1,6 +1,5 @@
-def build_grounding_prompt(query: str, context: str) -> str:
-    return f"""
-You are operating in strict governance mode.
+# Static parts of the prompt, built once; only context and query vary
+_PREFIX = """You are operating in strict governance mode.
 
 Rules:
 - You must answer strictly using the provided context.
@@ -10,8 +9,14 @@ Rules:
 - Do not use prior knowledge.
 
 Context:
-{context}
+"""
+
+_MIDDLE = """
 
 Question:
-{query}
-""".strip()
+"""
+
+
+def build_grounding_prompt(query: str, context: str) -> str:
+    # rstrip keeps the output identical to the previous .strip()ed template
+    return _PREFIX + context + _MIDDLE + query.rstrip()
@@ -13,6 +13,7 @@ class GovernRequest(BaseModel):
     context: str = Field(..., min_length=1)
     provider: ProviderEnum
     policy_config: Optional[dict] = None
+    use_cache: bool = True
 
     @field_validator("query", "context")
     @classmethod
@@ -33,6 +34,7 @@ class GovernResponse(BaseModel):
     output_tokens: int = Field(..., ge=0)
     latency_ms: int = Field(..., ge=0)
     provider: ProviderEnum
+    cached: bool
 
 
 class ErrorResponse(BaseModel):
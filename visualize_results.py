@@ -1,5 +1,6 @@
+import matplotlib
+matplotlib.use("Agg")  # PNG output only; skip GUI backend probing
 import matplotlib.pyplot as plt
-import pandas as pd
 
 # ================================
 # CONFIGURATION (Hardcoded from your real metrics)
@@ -21,18 +22,17 @@ SENTINEL = {
 # STYLE (Executive Minimal)
 # ================================
 
-plt.style.use("seaborn-v0_8-whitegrid")
+plt.rcParams.update({"axes.grid": True, "grid.alpha": 0.3})
 
-def save_bar_chart(title, baseline_value, sentinel_value, ylabel, filename):
+def draw_bars(ax, title, baseline_value, sentinel_value, ylabel):
     labels = ["Baseline LLM", "Sentinel Engine"]
     values = [baseline_value, sentinel_value]
 
-    plt.figure(figsize=(8, 5))
-    bars = plt.bar(labels, values)
+    bars = ax.bar(labels, values)
 
     for bar in bars:
         height = bar.get_height()
-        plt.text(
+        ax.text(
             bar.get_x() + bar.get_width() / 2,
             height,
             f"{height:.2f}",
@@ -40,38 +40,46 @@ def save_bar_chart(title, baseline_value, sentinel_value, ylabel, filename):
             va='bottom'
         )
 
-    plt.title(title, fontsize=14, weight="bold")
-    plt.ylabel(ylabel)
-    plt.tight_layout()
-    plt.savefig(filename, dpi=300)
-    plt.close()
+    ax.set_title(title, fontsize=14, weight="bold")
+    ax.set_ylabel(ylabel)
 
 # ================================
 # GENERATE VISUALS
 # ================================
 
-save_bar_chart(
-    "Fabrication Rate Comparison (%)",
-    BASELINE["fabrication_rate"],
-    SENTINEL["fabrication_rate"],
-    "Fabrication Rate (%)",
-    "fabrication_comparison.png"
-)
+CHARTS = [
+    (
+        "Fabrication Rate Comparison (%)",
+        BASELINE["fabrication_rate"],
+        SENTINEL["fabrication_rate"],
+        "Fabrication Rate (%)",
+        "fabrication_comparison.png"
+    ),
+    (
+        "P95 Latency Comparison (ms)",
+        BASELINE["p95_latency"],
+        SENTINEL["p95_latency"],
+        "Latency (ms)",
+        "latency_p95_comparison.png"
+    ),
+    (
+        "Cost per 100 Queries ($)",
+        BASELINE["cost_per_100"],
+        SENTINEL["cost_per_100"],
+        "Cost ($)",
+        "cost_comparison.png"
+    ),
+]
 
-save_bar_chart(
-    "P95 Latency Comparison (ms)",
-    BASELINE["p95_latency"],
-    SENTINEL["p95_latency"],
-    "Latency (ms)",
-    "latency_p95_comparison.png"
-)
+# Charts recycle one figure instead of creating three
+fig, ax = plt.subplots(figsize=(8, 5))
 
-save_bar_chart(
-    "Cost per 100 Queries ($)",
-    BASELINE["cost_per_100"],
-    SENTINEL["cost_per_100"],
-    "Cost ($)",
-    "cost_comparison.png"
-)
+for title, baseline_value, sentinel_value, ylabel, filename in CHARTS:
+    draw_bars(ax, title, baseline_value, sentinel_value, ylabel)
+    fig.tight_layout()
+    fig.savefig(filename, dpi=300)
+    ax.clear()
+
+plt.close(fig)
 
 print("Visual reports generated successfully.")